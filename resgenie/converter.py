@@ -6,11 +6,17 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
+from tempfile import NamedTemporaryFile
+import threading
+from typing import TYPE_CHECKING, cast
 
 
 from resgenie.core import Resume
 
+
+if TYPE_CHECKING:
+    from markdown import Markdown
+
 CSS = """
 <style>
 .markdown-body {
@@ -1111,6 +1117,19 @@ CSS = """
 </style>
 """
 
+_THREAD_LOCAL = threading.local()
+
+
+def _markdown() -> Markdown:
+    """Get this thread's markdown parser.
+    Markdown keeps per-conversion state on itself, so a parser is reused within a thread but never shared across threads"""
+    parser: Markdown | None = getattr(_THREAD_LOCAL, "markdown", None)
+    if parser is None:
+        import markdown
+
+        parser = _THREAD_LOCAL.markdown = markdown.Markdown(extensions=["tables"])
+    return parser
+
 
 @dataclass
 class Converter(ABC):
@@ -1130,6 +1149,10 @@ class Converter(ABC):
     ) -> str:
         """Convert the resume to a resume string blob"""
 
+    def convert_parts(self) -> list[str]:
+        """Convert the resume to a list of string fragments that, joined, form the resume blob"""
+        return [self.convert()]
+
     def to_file(
         self,
         file: str | Path,
@@ -1137,10 +1160,9 @@ class Converter(ABC):
         # template: TemplateFile # One day we'll do this
     ) -> None:
         """Convert the resume and save it to a file"""
-        content = self.convert()
         file = Path(file)
-        with file.open("w+", encoding=encoding) as handle:
-            handle.write(content)
+        with file.open("w", encoding=encoding, buffering=1 << 20) as handle:
+            handle.writelines(self.convert_parts())
 
 
 @dataclass
@@ -1156,130 +1178,91 @@ class MarkdownConverter(Converter):
 
     def build_header(self) -> str:
         """Build the header of the resume"""
-        body = CSS
-        body += "\n\n"
-        # contact
-        body += f"# {self.resume.contact.name}\n"
-        body += (
-            f"{self.resume.contact.address.city}, {self.resume.contact.address.state} | "
-            f"{self.resume.contact.phone} | {self.resume.contact.email}\n"
-        )
-        body += "\n"
-        return body
+        contact = self.resume.contact
+        return f"{CSS}\n\n# {contact.name}\n{contact.address.city}, {contact.address.state} | {contact.phone} | {contact.email}\n\n"
 
     def build_summary(self) -> str:
         """Build the summary"""
-        body = "# Professional Summary\n"
-        body += f"{self.resume.summary}\n\n"
-        return body
+        return f"# Professional Summary\n{self.resume.summary}\n\n"
 
     def build_skills(self) -> str:
         """Build the skills table"""
-        body = "# Skills\n"
-        body += """
+        parts: list[str] = ["# Skills\n"]
+        parts.append(
+            """
 <style>
     td, th {
         border: none!important;
     }
 </style>
-
-        """
-        body = body.strip()
-        body += "\n"
+"""
+        )
         skills = self.resume.get_skills_by_rank(reverse=False)
         longest = max(len(x[1].entries) for x in skills)
 
-        table = " | ".join([x[0] for x in skills])
-        table = "| " + table + " |\n"
-        for _ in skills:
-            table += "|:--- "
-        table += "|\n"
+        parts.append("| " + " | ".join(name for name, _ in skills) + " |\n")
+        parts.append("|:--- " * len(skills) + "|\n")
 
         for x in range(0, longest):
-            entry = "| "
-            for skill in skills:
-                if len(skill[1].entries) > x:
-                    entry += f"<span>&bull;</span> {skill[1].entries[x]}"
-                else:
-                    entry += " "
-                entry += " |"
-            entry += "\n"
-            table += entry
-
-        body += table
-        body += "\n\n"
-        return body
+            cells = [f"<span>&bull;</span> {group.entries[x]}" if len(group.entries) > x else " " for _, group in skills]
+            parts.append("| " + " | ".join(cells) + " |\n")
+
+        parts.append("\n\n")
+        return "".join(parts)
 
     def build_experience(self) -> str:
         """Build experience"""
-        body = "# Professional Experience\n"
+        parts: list[str] = ["# Professional Experience\n"]
         for entry in self.resume.experience:
-            body += f"## {entry.title}"
-            if entry.focus:
-                body += f" - {entry.focus}"
-            body += "\n"
-            body += f"**{entry.institution}** | {entry.start} - "
-            if entry.end:
-                body += entry.end
-            else:
-                body += "present"
-            body += f" | *{entry.location}*\n\n"
-            body += entry.summary
-            body += "\n\n"
-            for highlight in entry.highlights:
-                body += f" * {highlight}\n"
-            body += "\n"
-        return body
+            lines = [
+                f"## {entry.title} - {entry.focus}" if entry.focus else f"## {entry.title}",
+                f"**{entry.institution}** | {entry.start} - {entry.end or 'present'} | *{entry.location}*",
+                "",
+                entry.summary,
+                "",
+            ]
+            lines.extend(f" * {highlight}" for highlight in entry.highlights)
+            parts.append("\n".join(lines) + "\n\n")
+        return "".join(parts)
 
     def build_education(self) -> str:
         """Build education"""
-        body = "# Education and Course Work\n"
+        parts: list[str] = ["# Education and Course Work\n"]
         for entry in self.resume.education:
-            body += f"## {entry.degree}\n"
-            body += f"**{entry.institution}** | {entry.end} | *{entry.location}*\n\n"
-            body += f"*GPA*: {entry.gpa}\n\n"
+            lines = [
+                f"## {entry.degree}",
+                f"**{entry.institution}** | {entry.end} | *{entry.location}*",
+                "",
+                f"*GPA*: {entry.gpa}",
+                "",
+            ]
             if entry.specialty:
-                body += f"*Focus*: {entry.specialty}\n\n"
+                lines.extend((f"*Focus*: {entry.specialty}", ""))
             if entry.minor:
-                body += f"*Minor*: {entry.minor}\n\n"
-        body += "\n"
-        return body
+                lines.extend((f"*Minor*: {entry.minor}", ""))
+            parts.append("\n".join(lines) + "\n")
+        parts.append("\n")
+        return "".join(parts)
 
     def convert(
         self,
         # template: TemplateFile # One day we'll do this
     ) -> str:
         """Convert the resume to a resume string blob"""
+        return "".join(self.convert_parts())
+
+    def convert_parts(self) -> list[str]:
+        """Convert the resume to its section fragments, without joining them"""
         # pylint: disable=fixme
         # TODO: Move support to template-based
-        body = ""
-        body += self.build_header()
-
-        # summary
-        body += self.build_summary()
-
-        # skills
-        body += self.build_skills()
-        # experience
-
-        body += self.build_experience()
-        # education
-        body += self.build_education()
-
-        body += "\n*Generated with [resgenie](https://github.com/interifter/resgenie)*"
-        return body
-
-    def to_file(
-        self,
-        file: str | Path,
-        encoding: str = "UTF-8",
-        # template: TemplateFile # One day we'll do this
-    ) -> None:
-        """Convert the resume and save it to a file"""
-        content = self.convert()
-        file = Path(file)
-        with file.open("w+", encoding=encoding) as handle:
-            handle.write(content)
+        return [
+            self.build_header(),
+            self.build_summary(),
+            self.build_skills(),
+            self.build_experience(),
+            self.build_education(),
+            "\n*Generated with [resgenie](https://github.com/interifter/resgenie)*",
+        ]
 
 
 @dataclass
@@ -1292,26 +1275,12 @@ class HtmlConverter(Converter):
 
     def convert(self) -> str:
         """Convert to HTML"""
-        import markdown
-
-        html = markdown.markdown(MarkdownConverter(resume=self.resume).convert(), extensions=["tables"])
+        html = _markdown().reset().convert(MarkdownConverter(resume=self.resume).convert())
         html = "<head>\n" + html
         html = html.replace(f"<h1>{self.resume.contact.name}", f"\n</head>\n<body class='markdown-body'>\n<h1>{self.resume.contact.name}")
         html += "\n</body>"
         return cast(str, html)
 
-    def to_file(
-        self,
-        file: str | Path,
-        encoding: str = "UTF-8",
-        # template: TemplateFile # One day we'll do this
-    ) -> None:
-        """Convert the resume and save it to a file"""
-        content = self.convert()
-        file = Path(file)
-        with file.open("w+", encoding=encoding) as handle:
-            handle.write(content)
-
 
 @dataclass
 class PdfConverter(Converter):
@@ -1336,8 +1305,14 @@ class PdfConverter(Converter):
         """Convert the resume and save it to a file"""
         from pyhtml2pdf import converter
 
-        HtmlConverter.from_file(self.file).to_file("_resume.html")
-        converter.convert(str(Path("_resume.html").absolute()), str(file), timeout=2, print_options={"author": self.resume.contact.email})
-        Path("_resume.html").unlink()
+        with NamedTemporaryFile(suffix=".html", delete=False) as handle:
+            html_file = Path(handle.name)
+        try:
+            # self.resume was validated when it was loaded, so it is shared as-is rather than re-validated.
+            # If a converter ever needs its own copy, use Resume.model_construct to skip the validators again.
+            HtmlConverter(resume=self.resume).to_file(html_file)
+            converter.convert(str(html_file.absolute()), str(file), timeout=2, print_options={"author": self.resume.contact.email})
+        finally:
+            html_file.unlink()
         # # pylint: disable=no-value-for-parameter
         # cli(["-o", str(file), str(Path(self.file).absolute())], standalone_mode=False)
@@ -1,18 +1,35 @@
 """Core pydantic models for the transformations. Assumes US-based values"""
 
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 import re
-from typing import TypeVar
-from pydantic import BaseModel, EmailStr, field_validator
+from typing import TypeVar, cast
+from pydantic import BaseModel, field_validator
 import yaml
 
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - libyaml is not available on every platform
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
 Model = TypeVar("Model", bound="YamlModel")
 
 _PHONE_PATTERN = r"(\+[0-9]{0,3})?[\(\s\-]?([0-9]{3})[\)\s\.\-]?\s?([0-9]{3})[\s\.\-]?([0-9]{4})"
 _AREA_CODE_PATTERN = r"\([0-9]{3}\)"
 _COMPILED_PHONE_PATTERN = re.compile(_PHONE_PATTERN)
 _COMPILED_AREA_CODE_PATTERN = re.compile(_AREA_CODE_PATTERN)
+_EMAIL_PATTERN = r"[^@\s]+@[^@\s]+\.[^@\s]+"
+_COMPILED_EMAIL_PATTERN = re.compile(_EMAIL_PATTERN)
+
+
+@lru_cache(maxsize=64)
+def _load_model(model: type[Model], filename: str, mtime_ns: int, encoding: str) -> Model:  # pylint: disable=unused-argument
+    """Parse and validate a model file. mtime_ns is only part of the cache key, so edited files are reloaded"""
+    data = yaml.load(Path(filename).read_text(encoding=encoding), _SafeLoader)  # nosec B506 - always a safe loader
+    return model.model_validate(data)
 
 
 class YamlModel(BaseModel):
@@ -21,11 +38,10 @@ class YamlModel(BaseModel):
     @classmethod
     def from_file(cls: type[Model], filename: Path | str, encoding: str = "UTF-8") -> Model:
         """Load a pydantic model from a file, using the target encoding.
-        Supports YAML and JSON formats"""
-        filename = Path(filename)
-        with filename.open("r", encoding=encoding) as handle:
-            data = yaml.load(handle, yaml.SafeLoader)
-        return cls.model_validate(data)
+        Supports YAML and JSON formats. Unchanged files are only parsed once;
+        each call returns its own copy of the model"""
+        filename = Path(filename).resolve()
+        return cast(Model, _load_model(cls, str(filename), filename.stat().st_mtime_ns, encoding).model_copy(deep=True))
 
 
 class ResumeAddress(BaseModel):
@@ -38,19 +54,32 @@ class ResumeAddress(BaseModel):
 class ResumeContact(BaseModel):
     """Resume Contact information"""
 
-    email: EmailStr
+    email: str
     name: str
     phone: str
     address: ResumeAddress
 
+    @field_validator("email", mode="after")
+    @classmethod
+    def verify_email(cls, value: str) -> str:
+        """Verify the email address looks like an email address"""
+        if not _COMPILED_EMAIL_PATTERN.fullmatch(value):
+            raise ValueError(f"{value=} does not look like an email address. Expected something like name@example.com")
+        return value
+
     @field_validator("phone", mode="before")
     @classmethod
     def verify_phone(cls, value: str) -> str:
         """Verify the phone number looks like a phone number"""
-        results = re.search(_COMPILED_PHONE_PATTERN, value)
+        # The pattern needs at least 10 digits, so skip the regex when there cannot be a match
+        if len(value) < 10:
+            raise ValueError(f"Could not find all parts of {value=}. Expected 3 required and one optional (country code).")
+        results = _COMPILED_PHONE_PATTERN.search(value)
         if not results or not results.lastindex or results.lastindex < 4:
             raise ValueError(f"Could not find all parts of {value=}. Expected 3 required and one optional (country code).")
-        if ("(" in value or ")" in value) and not re.findall(_COMPILED_AREA_CODE_PATTERN, value):
+        if "(" not in value and ")" not in value:
+            return value
+        if not _COMPILED_AREA_CODE_PATTERN.search(value):
             raise ValueError(f"'(' or ')' exists, but could not match {_AREA_CODE_PATTERN}. Please correct your number")
         return value
 
@@ -116,10 +145,4 @@ class Resume(YamlModel):
 
     def get_skills_by_rank(self, reverse: bool = False) -> list[tuple[str, ResumeSkillGroup]]:
         """Get the skills in order of rank. Optionally reverse the list"""
-        ranks = [x.rank for x in self.skills.values()]
-        ranks.sort(reverse=reverse)
-        ordered: list[tuple[str, ResumeSkillGroup]] = []
-        for rank in ranks:
-            skill = next((k, v) for k, v in self.skills.items() if v.rank == rank)
-            ordered.append(skill)
-        return ordered
+        return sorted(self.skills.items(), key=lambda item: item[1].rank, reverse=reverse)
@@ -3,3 +3,4 @@
 from pathlib import Path
 
 HAPPY_PATH_YML_RESUME = Path(__file__).parent / "resume.yml"
+HAPPY_PATH_MD_RESUME = Path(__file__).parent / "resume.md"
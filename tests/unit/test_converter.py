@@ -0,0 +1,74 @@
+"""Unit tests for resgenie/converter.py"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from resgenie.converter import CSS, HtmlConverter, MarkdownConverter, _markdown
+from resgenie.core import Resume
+from tests.resources import HAPPY_PATH_MD_RESUME, HAPPY_PATH_YML_RESUME
+
+
+def test_markdown_convert() -> None:
+    """Happy path test to confirm the markdown output for our resume file"""
+    # resume.md holds everything after the stylesheet, with a trailing newline for editors
+    expected = CSS + HAPPY_PATH_MD_RESUME.read_text(encoding="UTF-8")
+    assert MarkdownConverter.from_file(HAPPY_PATH_YML_RESUME).convert() + "\n" == expected
+
+
+def test_markdown_convert_sparse_entries() -> None:
+    """Verify entries without highlights, focus, end, specialty or minor leave those parts out"""
+    data = Resume.from_file(HAPPY_PATH_YML_RESUME).model_dump()
+    data["experience"] = [
+        {"institution": "Spam Co", "title": "Eggs", "start": "2000", "location": "Ham, OR", "summary": "Waffles."},
+    ]
+    data["education"] = [
+        {"degree": "Spam", "end": "2001", "gpa": 3.5, "institution": "Eggs U", "location": "Ham, OR", "minor": None},
+    ]
+    converter = MarkdownConverter(resume=Resume.model_validate(data))
+
+    assert converter.build_experience() == "# Professional Experience\n## Eggs\n**Spam Co** | 2000 - present | *Ham, OR*\n\nWaffles.\n\n\n"
+    assert converter.build_education() == "# Education and Course Work\n## Spam\n**Eggs U** | 2001 | *Ham, OR*\n\n*GPA*: 3.5\n\n\n"
+
+
+def test_markdown_to_file(tmp_path: Path) -> None:
+    """Verify to_file writes exactly what convert returns"""
+    converter = MarkdownConverter.from_file(HAPPY_PATH_YML_RESUME)
+    output = tmp_path / "resume.md"
+    converter.to_file(output)
+    assert output.read_bytes() == converter.convert().encode("UTF-8")
+
+
+
+
+def test_html_convert_follows_resume() -> None:
+    """Verify repeated conversions are stable and follow a swapped resume"""
+    converter = HtmlConverter.from_file(HAPPY_PATH_YML_RESUME)
+    html = converter.convert()
+    assert converter.convert() == html
+
+    data = converter.resume.model_dump()
+    data["contact"]["name"] = "Spam Eggs"
+    converter.resume = Resume.model_validate(data)
+    swapped = converter.convert()
+    assert "<h1>Spam Eggs</h1>" in swapped
+    assert "Jack Carter" not in swapped
+
+
+def test_html_markdown_parser_per_thread() -> None:
+    """Verify the markdown parser is reused within a thread, not shared across threads, and output stays correct"""
+    resume = Resume.from_file(HAPPY_PATH_YML_RESUME)
+    expected = HtmlConverter(resume=resume).convert()
+    assert _markdown() is _markdown()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parsers = set(executor.map(lambda _: id(_markdown()), range(4)))
+        results = list(executor.map(lambda _: HtmlConverter(resume=resume).convert(), range(40)))
+    assert id(_markdown()) not in parsers
+    assert results == [expected] * 40
+
+
+def test_html_to_file(tmp_path: Path) -> None:
+    """Verify to_file writes exactly what convert returns for converters without their own fragments"""
+    converter = HtmlConverter.from_file(HAPPY_PATH_YML_RESUME)
+    output = tmp_path / "resume.html"
+    converter.to_file(output)
+    assert output.read_bytes() == converter.convert().encode("UTF-8")
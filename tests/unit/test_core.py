@@ -1,7 +1,11 @@
 """Unit tests for resgenie/core.py"""
 
+import os
+from pathlib import Path
+import time
 import pytest
-from resgenie.core import ResumeContact, Resume
+import yaml
+from resgenie.core import ResumeContact, Resume, _load_model
 from tests.resources import HAPPY_PATH_YML_RESUME
 
 
@@ -22,6 +26,8 @@ def test_load_resume_from_file() -> None:
         ("555.555.555", ValueError),
         ("555.555.5555", None),
         ("555 555-5555", None),
+        ("555-5555", ValueError),
+        ("", ValueError),
     ],
 )
 def test_resume_contact_verify_phone(number: str, expected_exception: type[BaseException] | None) -> None:
@@ -36,6 +42,30 @@ def test_resume_contact_verify_phone(number: str, expected_exception: type[BaseE
             ResumeContact.verify_phone(number)  # type: ignore[call-arg]
 
 
+@pytest.mark.parametrize(
+    "email, expected_exception",
+    [
+        ("spam@eggs.com", None),
+        ("spam.ham+waffles@eggs.co.uk", None),
+        ("Spam@EGGS.com", None),
+        ("Spam <spam@eggs.com>", ValueError),
+        ("spam@eggs.com\n", ValueError),
+        ("spam@eggs", ValueError),
+        ("spam eggs@ham.com", ValueError),
+        ("spam@@eggs.com", ValueError),
+        ("@eggs.com", ValueError),
+    ],
+)
+def test_resume_contact_verify_email(email: str, expected_exception: type[BaseException] | None) -> None:
+    """Different use cases to ensure verify email rejects obviously malformed addresses.
+    Addresses are returned as written; unlike EmailStr, display names are rejected and nothing is normalized"""
+    if not expected_exception:
+        assert ResumeContact.verify_email(email) == email
+    else:
+        with pytest.raises(expected_exception):
+            ResumeContact.verify_email(email)
+
+
 def test_resume_skills_ranks() -> None:
     """Verify a ValueError is raised when resume skill ranks are duplicated"""
     buckets = {
@@ -48,3 +78,46 @@ def test_resume_skills_ranks() -> None:
     with pytest.raises(ValueError) as exc_info:
         Resume.verify_ranks(buckets)  # type: ignore[call-arg]
     assert "Found: rank duplicates={1: ['spam', 'dosa']" in exc_info.value.args[0]
+
+
+@pytest.mark.parametrize("reverse, expected", [(False, ["spam", "waffles", "bulgogi"]), (True, ["bulgogi", "waffles", "spam"])])
+def test_resume_get_skills_by_rank(reverse: bool, expected: list[str]) -> None:
+    """Verify skills are ordered by rank, optionally reversed"""
+    data = Resume.from_file(HAPPY_PATH_YML_RESUME).model_dump()
+    data["skills"] = {
+        "bulgogi": {"rank": 5, "entries": ["adobo"]},
+        "spam": {"rank": 1, "entries": ["eggs"]},
+        "waffles": {"rank": 2, "entries": ["pandan"]},
+    }
+    resume = Resume.model_validate(data)
+    assert [name for name, _ in resume.get_skills_by_rank(reverse=reverse)] == expected
+
+
+def test_load_resume_from_file_cached(tmp_path: Path) -> None:
+    """Verify repeated loads reuse the parsed file, hand out independent copies, and reload edited files"""
+    resume_file = tmp_path / "resume.yml"
+    resume_file.write_text(HAPPY_PATH_YML_RESUME.read_text(encoding="UTF-8"), encoding="UTF-8")
+
+    _load_model.cache_clear()
+    first = Resume.from_file(resume_file)
+    second = Resume.from_file(resume_file)
+    info = _load_model.cache_info()  # pylint: disable=no-value-for-parameter
+    assert (info.hits, info.misses) == (1, 1)
+    assert first == second
+    assert first is not second
+    first.summary = "spam"
+    assert second.summary != "spam"
+
+    edited = Resume.from_file(resume_file).model_dump()
+    edited["summary"] = "eggs"
+    resume_file.write_text(yaml.safe_dump(edited), encoding="UTF-8")
+    os.utime(resume_file, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+    assert Resume.from_file(resume_file).summary == "eggs"
+    info = _load_model.cache_info()  # pylint: disable=no-value-for-parameter
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_load_resume_from_missing_file(tmp_path: Path) -> None:
+    """Verify a missing file raises FileNotFoundError"""
+    with pytest.raises(FileNotFoundError):
+        Resume.from_file(tmp_path / "missing.yml")